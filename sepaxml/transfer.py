@@ -20,11 +20,10 @@ CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 """
 
 import datetime
-import re
 import xml.etree.ElementTree as ET
 
 from .shared import SepaPaymentInitn
-from .utils import ADDRESS_MAPPING, int_to_decimal_str, make_id, validate_structured_reference
+from .utils import ADDRESS_MAPPING, clean_structured_reference, int_to_decimal_str, make_id, validate_structured_reference
 
 
 class SepaTransfer(SepaPaymentInitn):
@@ -210,7 +209,7 @@ class SepaTransfer(SepaPaymentInitn):
                 tp_node.append(cd_or_prtry_node)
 
             # Clean structured reference (remove formatting characters)
-            clean_ref = re.sub(r'[/+\s]', '', payment['structured_reference'])
+            clean_ref = clean_structured_reference(payment['structured_reference'])
             ref_node = ET.Element('Ref')
             ref_node.text = clean_ref
 
@@ -23,6 +23,7 @@ import datetime
 import hashlib
 import random
 import re
+import string
 import time
 
 try:
@@ -111,6 +112,26 @@ def decimal_str_to_int(decimal_string):
     return int(int_string)
 
 
+# Translation table mapping A-Z to 10-35 for the ISO 11649 mod 97 check
+_ISO11649_LETTER_VALUES = str.maketrans(
+    {chr(ord('A') + i): str(10 + i) for i in range(26)}
+)
+
+
+# Characters allowed in the reference part of an ISO 11649 reference
+_ISO11649_ALPHABET = frozenset(string.ascii_uppercase + string.digits)
+
+
+def clean_structured_reference(reference):
+    """
+    Strip the formatting characters (/, + and whitespace) from a
+    structured reference.
+    @param reference: The structured reference string
+    @return: The reference without formatting characters
+    """
+    return ''.join(reference.replace('/', '').replace('+', '').split())
+
+
 def validate_structured_reference(reference, format_type='ISO'):
     """
     Validate a structured communication reference.
@@ -122,10 +143,10 @@ def validate_structured_reference(reference, format_type='ISO'):
     if format_type == 'BBA':
         # BBA format: 12 digits in format XXX/XXXX/XXXCC where CC is check digit (modulo 97)
         # Remove any formatting characters (/, +, spaces)
-        clean_ref = re.sub(r'[/+\s]', '', reference)
+        clean_ref = clean_structured_reference(reference)
 
         # Must be exactly 12 digits
-        if not re.match(r'^\d{12}$', clean_ref):
+        if len(clean_ref) != 12 or not clean_ref.isdecimal():
             raise Exception(
                 f"STRUCTURED_REFERENCE_INVALID: BBA format requires exactly 12 digits, got '{reference}'. "
                 f"Format should be XXX/XXXX/XXXCC or 12 consecutive digits."
@@ -168,7 +189,7 @@ def validate_structured_reference(reference, format_type='ISO'):
 
         # Check that the reference part contains only alphanumeric characters
         ref_part = clean_ref[4:]
-        if ref_part and not re.match(r'^[A-Z0-9]+$', ref_part):
+        if not _ISO11649_ALPHABET.issuperset(ref_part):
             raise Exception(
                 f"STRUCTURED_REFERENCE_INVALID: ISO 11649 reference must contain only alphanumeric characters, got '{ref_part}'"
             )
@@ -177,14 +198,7 @@ def validate_structured_reference(reference, format_type='ISO'):
         # Move RF and check digits to end, convert letters to numbers, calculate mod 97
         rearranged = clean_ref[4:] + clean_ref[:4]
         # Convert letters to numbers (A=10, B=11, ..., Z=35)
-        numeric_string = ''
-        for char in rearranged:
-            if char.isdigit():
-                numeric_string += char
-            else:
-                numeric_string += str(ord(char) - ord('A') + 10)
-
-        checksum = int(numeric_string) % 97
+        checksum = int(rearranged.translate(_ISO11649_LETTER_VALUES)) % 97
         if checksum != 1:
             raise Exception(
                 f"STRUCTURED_REFERENCE_INVALID_CHECKSUM: ISO 11649 checksum validation failed for '{reference}'"
@@ -18,6 +18,7 @@ AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY
 WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
 CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 """
+import functools
 import os
 
 
@@ -25,10 +26,20 @@ class ValidationError(Exception):
     pass
 
 
+@functools.lru_cache(maxsize=None)
+def _load_schema(schema):
+    """
+    Build the XMLSchema for the given schema name. Compiling the XSD is by far
+    the most expensive part of an export, so every schema is only built once.
+    """
+    import xmlschema  # xmlschema does some weird monkeypatching in etree, if we import it globally, things fail
+    return xmlschema.XMLSchema(os.path.join(os.path.dirname(__file__), 'schemas', schema + '.xsd'))
+
+
 def try_valid_xml(xmlout, schema):
     import xmlschema  # xmlschema does some weird monkeypatching in etree, if we import it globally, things fail
     try:
-        my_schema = xmlschema.XMLSchema(os.path.join(os.path.dirname(__file__), 'schemas', schema + '.xsd'))
+        my_schema = _load_schema(schema)
         my_schema.validate(xmlout.decode())
 
     except xmlschema.XMLSchemaValidationError as e:
@@ -0,0 +1,191 @@
+import datetime
+from types import MappingProxyType
+
+import pytest
+from lxml import etree
+
+from sepaxml import SepaDD, SepaTransfer
+from tests.utils import validate_xml_tree
+
+TODAY = datetime.date.today()
+
+# Shared by every payment; add_payment mutates its argument, so always copy.
+_BASE_PAYMENT = MappingProxyType({
+    "name": "Test von Testenstein",
+    "IBAN": "NL50BANK1234567890",
+    "BIC": "BANKNL2A",
+    "amount": 1012,
+})
+
+# (class, schema, config, date fields, extra payment fields)
+CASES = [
+    (
+        SepaDD,
+        "pain.008.001.02",
+        {
+            "name": "TestCreditor",
+            "IBAN": "NL50BANK1234567890",
+            "BIC": "BANKNL2A",
+            "batch": True,
+            "creditor_id": "DE26ZZZ00000000000",
+            "currency": "EUR",
+        },
+        ("collection_date", "mandate_date"),
+        MappingProxyType({"mandate_id": "1234", "type": "FRST"}),
+    ),
+    (
+        SepaTransfer,
+        "pain.001.001.03",
+        {
+            "name": "TestCreditor",
+            "IBAN": "NL50BANK1234567890",
+            "BIC": "BANKNL2A",
+            "batch": True,
+            "currency": "EUR",
+        },
+        ("execution_date",),
+        MappingProxyType({}),
+    ),
+]
+
+
+def _compile_xpaths(schema):
+    ns = {"doc": "urn:iso:std:iso:20022:tech:xsd:" + schema}
+    return {
+        tag: etree.XPath(".//doc:" + tag, namespaces=ns)
+        for tag in ("Strd", "Ref", "Cd", "Ustrd")
+    }
+
+
+# Compiled once per schema and shared by all tests
+XPATHS = {schema: _compile_xpaths(schema) for _, schema, _, _, _ in CASES}
+
+
+@pytest.fixture(scope="module", params=CASES, ids=["debit", "transfer"])
+def case(request):
+    return request.param
+
+
+@pytest.fixture(scope="module")
+def sepa_factory(case):
+    cls, schema, config, _, _ = case
+
+    def _make():
+        # The constructor mutates the config dict, so hand it a copy.
+        return cls(dict(config), schema=schema)
+    return _make
+
+
+def make_payment(case, **fields):
+    _, _, _, date_keys, extra = case
+    return {
+        **_BASE_PAYMENT,
+        **dict.fromkeys(date_keys, TODAY),
+        **extra,
+        **fields,
+    }
+
+
+def test_structured_reference(case, sepa_factory):
+    sepa = sepa_factory()
+    schema = case[1]
+    # Both reference types go into one document so it is only validated once.
+    # Using a valid BBA structured reference: 000/0000/00196 (base 0000000001, check digit 96)
+    # Check digit = 97 - (1 % 97) = 96
+    sepa.add_payment(make_payment(
+        case,
+        structured_reference="000/0000/00196",
+        structured_reference_type="BBA",
+    ))
+    # Using a valid ISO 11649 RF reference: RF56TEST123
+    sepa.add_payment(make_payment(
+        case,
+        structured_reference="RF56TEST123",
+        structured_reference_type="ISO",
+    ))
+
+    xmlout = sepa.export()
+    xml = validate_xml_tree(xmlout, schema)
+    xpaths = XPATHS[schema]
+
+    # Check that the structured reference nodes exist and have correct values
+    strd_nodes = xpaths["Strd"](xml)
+    assert len(strd_nodes) == 2
+
+    ref_nodes = xpaths["Ref"](xml)
+    assert len(ref_nodes) == 2
+    # Should be cleaned (formatting and spaces removed, uppercase)
+    assert {node.text for node in ref_nodes} == {"000000000196", "RF56TEST123"}
+
+    cd_nodes = xpaths["Cd"](xml)
+    assert any(node.text == "SCOR" for node in cd_nodes)
+
+    # Check that no Ustrd node exists in RmtInf
+    ustrd_nodes = xpaths["Ustrd"](xml)
+    assert len(ustrd_nodes) == 0
+
+
+def test_unstructured_reference(case, sepa_factory):
+    sepa = sepa_factory()
+    schema = case[1]
+    payment = make_payment(case, description="Test transaction")
+
+    sepa.add_payment(payment)
+    xmlout = sepa.export()
+    xml = validate_xml_tree(xmlout, schema)
+    xpaths = XPATHS[schema]
+
+    # Check that the unstructured reference node exists
+    ustrd_nodes = xpaths["Ustrd"](xml)
+    assert len(ustrd_nodes) == 1
+    assert ustrd_nodes[0].text == "Test transaction"
+
+    # Check that no structured reference nodes exist
+    strd_nodes = xpaths["Strd"](xml)
+    assert len(strd_nodes) == 0
+
+
+@pytest.fixture(scope="class")
+def shared_sepa(sepa_factory):
+    return sepa_factory()
+
+
+class TestNegativePaths:
+
+    @pytest.mark.parametrize("fields, expected_error", [
+        ({}, "DESCRIPTION_MISSING"),
+        (
+            {"description": "Test transaction", "structured_reference": "000/0001/00096"},
+            "CANNOT_HAVE_BOTH_DESCRIPTION_AND_STRUCTURED_REFERENCE",
+        ),
+        (
+            # Invalid: too many digits
+            {"structured_reference": "617094556122022", "structured_reference_type": "BBA"},
+            "STRUCTURED_REFERENCE_INVALID",
+        ),
+        (
+            # Invalid checksum (should be 96)
+            {"structured_reference": "000/0001/00099", "structured_reference_type": "BBA"},
+            "STRUCTURED_REFERENCE_INVALID_CHECKSUM",
+        ),
+        (
+            # Invalid checksum (should be 56)
+            {"structured_reference": "RF99TEST123", "structured_reference_type": "ISO"},
+            "STRUCTURED_REFERENCE_INVALID_CHECKSUM",
+        ),
+    ], ids=[
+        "missing_references",
+        "both_references",
+        "invalid_structured_reference_format",
+        "invalid_structured_reference_checksum",
+        "invalid_iso11649_reference",
+    ])
+    def test_invalid_payment(self, case, shared_sepa, fields, expected_error):
+        payment = make_payment(case, **fields)
+
+        with pytest.raises(Exception, match=expected_error):
+            shared_sepa.add_payment(payment)
+
+        # Payments are validated before anything is added, which is what makes
+        # sharing one instance across these tests safe.
+        assert not shared_sepa._batches
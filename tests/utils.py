@@ -1,3 +1,4 @@
+import functools
 import os
 import re
 
@@ -6,14 +7,22 @@ from lxml import etree
 from sepaxml import validation
 
 
-def validate_xml(xmlout, schema):
+@functools.lru_cache(maxsize=None)
+def _load_schema(schema):
     with open(os.path.join(os.path.dirname(validation.__file__), 'schemas', schema + '.xsd'), 'rb') as schema_file:
         schema_xml = schema_file.read()
     schema_root = etree.XML(schema_xml)
-    schema = etree.XMLSchema(schema_root)
-    parser = etree.XMLParser(schema=schema)
-    xml_root = etree.fromstring(xmlout, parser)
-    return etree.tostring(xml_root, pretty_print=True)
+    return etree.XMLSchema(schema_root)
+
+
+def validate_xml_tree(xmlout, schema):
+    xml_root = etree.fromstring(xmlout)
+    _load_schema(schema).assertValid(xml_root)
+    return xml_root
+
+
+def validate_xml(xmlout, schema):
+    return etree.tostring(validate_xml_tree(xmlout, schema), pretty_print=True)
 
 
 def clean_ids(xmlout):